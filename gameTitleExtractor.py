@@ -9,45 +9,72 @@ Description: This application allows users to select a game console and director
 """
 
 import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import tkinter as tk
 from tkinter import scrolledtext, filedialog, ttk, messagebox
 from datetime import datetime
-import webbrowser
+from itertools import chain
+
+def _open_path(path):
+    # Hand the path to the platform's file manager / default application
+    if sys.platform == 'win32':
+        os.startfile(path)
+    elif sys.platform == 'darwin':
+        subprocess.Popen(['open', path])
+    else:
+        subprocess.Popen(['xdg-open', path])
 
 class GameTitlesExtractor(tk.Tk):
+    # File suffixes (lowercase) recognised as game archives
+    SUFFIXES = ('.zip',)
+    # Number of directory scans remembered between runs
+    SCAN_CACHE_SIZE = 16
+    # Set to True to log debug details when a process starts
+    DEBUG = False
+
+    # Popular home and handheld game consoles, shared by all instances
+    POPULAR_CONSOLES = (
+        "Atari 2600",
+        "Nintendo Entertainment System (NES)",
+        "Super Nintendo Entertainment System (SNES)",
+        "Nintendo 64",
+        "Sega Genesis",
+        "Sega Saturn",
+        "Sega Dreamcast",
+        "Sony PlayStation",
+        "Sony PlayStation 2",
+        "Nintendo GameCube",
+        "Nintendo Wii",
+        "Xbox",
+        "Xbox 360",
+        "Nintendo Game Boy (GBC)",
+        # "Nintendo Game Boy Color",
+        "Nintendo Game Boy Advance",
+        "Nintendo DS",
+        "Nintendo 3DS",
+        "PlayStation Portable (PSP)",
+        "PlayStation Vita",
+        "Atari Lynx",
+        "Neo Geo Pocket",
+        "TurboGrafx-16 Portable"
+    )
+
     def __init__(self):
         super().__init__()
         self.title("Game Titles Extractor")
         self.console_entries = {}
         self.selected_console = None
         self.output_files = {}
+        self._scan_cache = {}
+        self._scan_cache_lock = threading.Lock()
+        self._log_buffer = []
+        self._log_flush_pending = False
+        self._log_lock = threading.Lock()
 
-        # List of popular home and handheld game consoles
-        self.popular_consoles = [
-            "Atari 2600",
-            "Nintendo Entertainment System (NES)",
-            "Super Nintendo Entertainment System (SNES)",
-            "Nintendo 64",
-            "Sega Genesis",
-            "Sega Saturn",
-            "Sega Dreamcast",
-            "Sony PlayStation",
-            "Sony PlayStation 2",
-            "Nintendo GameCube",
-            "Nintendo Wii",
-            "Xbox",
-            "Xbox 360",
-            "Nintendo Game Boy (GBC)",
-            # "Nintendo Game Boy Color",
-            "Nintendo Game Boy Advance",
-            "Nintendo DS",
-            "Nintendo 3DS",
-            "PlayStation Portable (PSP)",
-            "PlayStation Vita",
-            "Atari Lynx",
-            "Neo Geo Pocket",
-            "TurboGrafx-16 Portable"
-        ]
+        self._max_console_width = len(max(self.POPULAR_CONSOLES, key=len))
 
         # GUI Elements
         self.create_widgets()
@@ -56,10 +83,9 @@ class GameTitlesExtractor(tk.Tk):
         ttk.Label(self, text="Console Name:").grid(column=0, row=0, padx=10, pady=5, sticky=tk.W)
 
         self.console_var = tk.StringVar()
-        self.console_dropdown = ttk.Combobox(self, textvariable=self.console_var, state='readonly', width=35)
-        self.console_dropdown['values'] = self.popular_consoles
+        self.console_dropdown = ttk.Combobox(self, textvariable=self.console_var, state='readonly', width=self._max_console_width)
+        self.console_dropdown['values'] = self.POPULAR_CONSOLES
         self.console_dropdown.grid(column=1, row=0, padx=10, pady=5)
-        self.console_dropdown.bind("<Configure>", self.adjust_combobox_width)
 
         self.select_console_button = ttk.Button(self, text="Select Console", command=self.select_console)
         self.select_console_button.grid(column=2, row=0, padx=10, pady=5, sticky=tk.W)
@@ -89,14 +115,11 @@ class GameTitlesExtractor(tk.Tk):
         self.log_text = scrolledtext.ScrolledText(self, width=70, height=15, wrap=tk.WORD)
         self.log_text.grid(column=0, row=5, columnspan=3, padx=10, pady=10)
 
-    def adjust_combobox_width(self, event):
-        self.console_dropdown.configure(width=len(max(self.popular_consoles, key=len)))
-
     def select_console(self):
         console_name = self.console_var.get()
         if console_name:
             self.selected_console = console_name
-            self.console_entries[console_name] = self.console_entries.get(console_name, "")
+            self.console_entries.setdefault(console_name, "")
             self.select_console_button.config(text="Change Console")
             self.log_message(f"Selected console: {console_name}")
         else:
@@ -106,49 +129,65 @@ class GameTitlesExtractor(tk.Tk):
     def browse_directory(self):
         directory = filedialog.askdirectory()
         if directory:
-            self.directory_entry.delete(0, tk.END)
-            self.directory_entry.insert(0, directory)
-            if self.selected_console:
-                self.console_entries[self.selected_console] = directory
-                self.log_message(f"Selected directory for {self.selected_console}: {directory}")
-            else:
-                messagebox.showinfo("Info", "You need to select a console first!")
-                self.log_message("Info: Attempt to select a directory without a selected console.")
+            # Let the dialog finish tearing down before touching the rest of the UI
+            self.after_idle(self._apply_directory, directory)
+
+    def _apply_directory(self, directory):
+        self.directory_entry.delete(0, tk.END)
+        self.directory_entry.insert(0, directory)
+        if self.selected_console:
+            self.console_entries[self.selected_console] = directory
+            self.log_message(f"Selected directory for {self.selected_console}: {directory}")
+        else:
+            messagebox.showinfo("Info", "You need to select a console first!")
+            self.log_message("Info: Attempt to select a directory without a selected console.")
 
     def log_message(self, message):
-        self.log_text.insert(tk.END, message + "\n")
+        # Messages are buffered and written to the widget in one go once Tk is idle,
+        # which also keeps widget access on the main loop when called from worker threads
+        with self._log_lock:
+            self._log_buffer.append(message)
+            if self._log_flush_pending:
+                return
+            self._log_flush_pending = True
+        self.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        with self._log_lock:
+            messages = self._log_buffer
+            self._log_buffer = []
+            self._log_flush_pending = False
+        self.log_text.insert(tk.END, "\n".join(messages) + "\n")
         self.log_text.see(tk.END)
 
     def get_game_titles(self, directory):
-        game_titles = []
-        try:
-            for file_name in os.listdir(directory):
-                if file_name.endswith('.zip'):
-                    game_titles.append(file_name)
-        except FileNotFoundError:
-            self.log_message(f"Error: The directory '{directory}' does not exist.")
-        except PermissionError:
-            self.log_message(f"Error: Permission denied to access the directory '{directory}'.")
-        except Exception as e:
-            self.log_message(f"An unexpected error occurred while accessing the directory '{directory}': {e}")
-        return game_titles
+        # Errors propagate to the caller so an interrupted scan is never mistaken for a complete one
+        endswith = str.endswith
+        suffixes = self.SUFFIXES
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if endswith(entry.name.lower(), suffixes) and entry.is_file(follow_symlinks=False):
+                    yield entry.name
 
-    def write_game_titles(self, directory, console_name, game_titles):
+    def write_game_titles(self, directory, console_name, game_titles, date_str):
         try:
-            date_str = datetime.now().strftime("%Y-%m-%d")
             file_name = f"{console_name}_{date_str}.txt"
             file_path = os.path.join(directory, file_name)
             self.log_message(f"Attempting to write file to: {file_path}")
-            if game_titles:  # Only write the file if there are game titles
-                with open(file_path, 'w') as file:
-                    file.write(f"Console: {console_name}\n")
-                    file.write(f"Warning: We do not know if the list below is actual {console_name} game titles or not. Please double-check by yourself.\n\n")
-                    for title in game_titles:
-                        file.write(title + '\n')
+            game_titles = iter(game_titles)
+            first_title = next(game_titles, None)
+            if first_title is not None:  # Only write the file if there are game titles
+                # Binary mode skips the text codec; emit the platform line ending explicitly
+                newline = os.linesep
+                header = (f"Console: {console_name}{newline}"
+                          f"Warning: We do not know if the list below is actual {console_name} game titles or not. Please double-check by yourself.{newline}{newline}")
+                body = header + newline.join(chain((first_title,), game_titles)) + newline
+                # 1 MiB buffer keeps large lists down to a handful of write syscalls
+                with open(file_path, 'wb', buffering=1 << 20) as file:
+                    file.write(body.encode('utf-8'))
                 self.log_message(f"Game titles have been written to {file_path}")
                 self.output_files[console_name] = file_path
-                self.open_folder_button.config(state='normal')
-                self.open_file_button.config(state='normal')
+                self.after(0, self._enable_output_buttons)
             else:
                 self.log_message(f"No game titles found in the directory: {directory}")
         except FileNotFoundError:
@@ -159,36 +198,120 @@ class GameTitlesExtractor(tk.Tk):
             self.log_message(f"An unexpected error occurred while writing to the file '{file_path}': {e}")
 
     def start_process(self):
-        self.log_message(f"Debug: Start process initiated. Selected console: {self.selected_console}")
-        self.log_message(f"Debug: Console entries: {self.console_entries}")
+        if self.DEBUG:
+            self.log_message(f"Debug: Start process initiated. Selected console: {self.selected_console}")
+            self.log_message(f"Debug: Console entries: {self.console_entries}")
         if not self.selected_console or not self.console_entries.get(self.selected_console):
             messagebox.showinfo("Info", "You need to select a console and a directory first!")
             self.log_message("Info: Attempt to start process without selecting both console and directory.")
             return
 
         self.progress_bar['value'] = 0
-        total_consoles = len(self.console_entries)
-        for idx, (console_name, directory) in enumerate(self.console_entries.items()):
-            self.log_message(f"Processing {console_name} with directory '{directory}'...")
-            if not os.path.exists(directory):
-                self.log_message(f"Error: The directory '{directory}' does not exist.")
-                continue
-            game_titles = self.get_game_titles(directory)
-            self.write_game_titles(directory, console_name, game_titles)
-            self.progress_bar['value'] += (100 / total_consoles)
-
-        self.log_message("Process completed.")
-        self.progress_bar['value'] = 100
+        self.start_button.config(state='disabled')
+        date_str = datetime.now().strftime("%Y-%m-%d")
+        # Snapshot the entries so later UI edits cannot mutate the dict under the worker
+        items = tuple(self.console_entries.items())
+        threading.Thread(target=self._run, args=(items, date_str), daemon=True).start()
+
+    def _scan_console(self, console_name, directory):
+        self.log_message(f"Processing {console_name} with directory '{directory}'...")
+        try:
+            st = os.stat(directory)
+            # Adding or removing a file bumps the directory mtime, which invalidates the entry
+            with self._scan_cache_lock:
+                cached = self._scan_cache.pop(directory, None)
+                if cached is not None and cached[0] == st.st_mtime_ns:
+                    self._scan_cache[directory] = cached
+                    return console_name, directory, cached[1]
+
+            game_titles = list(self.get_game_titles(directory))
+        except FileNotFoundError:
+            self.log_message(f"Error: The directory '{directory}' does not exist.")
+            return console_name, directory, None
+        except PermissionError:
+            self.log_message(f"Error: Permission denied to access the directory '{directory}'.")
+            return console_name, directory, None
+        except Exception as e:
+            self.log_message(f"An unexpected error occurred while accessing the directory '{directory}': {e}")
+            return console_name, directory, None
+
+        # Only complete scans reach this point, so a partial listing is never cached
+        if game_titles:
+            with self._scan_cache_lock:
+                self._scan_cache[directory] = (st.st_mtime_ns, game_titles)
+                while len(self._scan_cache) > self.SCAN_CACHE_SIZE:
+                    del self._scan_cache[next(iter(self._scan_cache))]
+        return console_name, directory, game_titles
+
+    def _directory_mtime(self, directory):
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def _restamp_scan_cache(self, directory, mtime_before_write):
+        # Writing our own output file bumps the directory mtime; carry the cached scan over
+        # to the new mtime, unless something else changed the directory before the write
+        mtime_after_write = self._directory_mtime(directory)
+        with self._scan_cache_lock:
+            cached = self._scan_cache.get(directory)
+            if cached is None:
+                return
+            if mtime_after_write is None or cached[0] != mtime_before_write:
+                del self._scan_cache[directory]
+            else:
+                self._scan_cache[directory] = (mtime_after_write, cached[1])
+
+    def _run(self, items, date_str):
+        # Runs in a worker thread; all widget updates go through self.after
+        try:
+            total = len(items)
+            step = 100.0 / total
+            with ThreadPoolExecutor(max_workers=min(8, total)) as executor:
+                futures = {executor.submit(self._scan_console, console_name, directory): console_name
+                           for console_name, directory in items}
+                # Scans run concurrently, but files are written one at a time from here
+                for idx, future in enumerate(as_completed(futures)):
+                    try:
+                        console_name, directory, game_titles = future.result()
+                    except Exception as e:
+                        # One failing console must not cancel the others
+                        self.log_message(f"An unexpected error occurred while processing {futures[future]}: {e}")
+                        game_titles = None
+                    if game_titles is not None:
+                        mtime_before_write = self._directory_mtime(directory)
+                        self.write_game_titles(directory, console_name, game_titles, date_str)
+                        self._restamp_scan_cache(directory, mtime_before_write)
+                    self.after(0, self._update_progress, step * (idx + 1))
+
+            self.log_message("Process completed.")
+            self.after(0, self._update_progress, 100)
+        finally:
+            self.after(0, self.start_button.config, {'state': 'normal'})
+
+    def _update_progress(self, value):
+        self.progress_bar['value'] = value
+
+    def _enable_output_buttons(self):
+        self.open_folder_button.config(state='normal')
+        self.open_file_button.config(state='normal')
 
     def open_folder(self):
-        if self.selected_console and self.selected_console in self.output_files:
-            directory = os.path.dirname(self.output_files[self.selected_console])
-            webbrowser.open(directory)
+        file_path = self.output_files.get(self.selected_console)
+        if file_path:
+            directory = os.path.dirname(file_path)
+            try:
+                _open_path(directory)
+            except OSError as e:
+                self.log_message(f"Error: Could not open the folder '{directory}': {e}")
 
     def open_file(self):
-        if self.selected_console and self.selected_console in self.output_files:
-            file_path = self.output_files[self.selected_console]
-            webbrowser.open(file_path)
+        file_path = self.output_files.get(self.selected_console)
+        if file_path:
+            try:
+                _open_path(file_path)
+            except OSError as e:
+                self.log_message(f"Error: Could not open the file '{file_path}': {e}")
 
 if __name__ == "__main__":
     app = GameTitlesExtractor()